@@ -202,7 +202,8 @@ class TensorBlock:
         """
         get a deep copy of this block, including all the data and metadata
         """
-        return copy.deepcopy(self)
+        # call `__deepcopy__` directly instead of going through `copy.deepcopy`
+        return self.__deepcopy__({})
 
     def __repr__(self) -> str:
         if self._actual_ptr is None:
@@ -1,4 +1,5 @@
 import ctypes
+from collections import namedtuple
 from typing import Union
 
 import numpy as np
@@ -55,6 +56,30 @@ def _origin_pytorch():
     return _TORCH_STORAGE_ORIGIN
 
 
+def _array_backend(array):
+    """
+    Get the :py:class:`_ArrayBackend` for ``array``. The lookup is done on the
+    exact type of the array, and subclasses are added to the cache the first
+    time they are seen.
+    """
+    array_type = type(array)
+    backend = _ARRAY_BACKENDS.get(array_type)
+    if backend is None:
+        # subclasses might override `copy`/`clone`/`new_zeros`, so they use a
+        # backend calling the methods on the array instead of the base class
+        # functions
+        if _is_numpy_array(array):
+            backend = _NUMPY_SUBCLASS_BACKEND
+        elif _is_torch_array(array):
+            backend = _TORCH_SUBCLASS_BACKEND
+        else:
+            raise ValueError(f"unknown array type: {type(array)}")
+
+        _ARRAY_BACKENDS[array_type] = backend
+
+    return backend
+
+
 if HAS_TORCH:
     torch_dtype = torch.dtype
     torch_device = torch.device
@@ -157,46 +182,34 @@ class DeviceWarning(RuntimeWarning):
     """
 
 
+# Size of the pre-allocated shape buffer in `ArrayWrapper`. Most arrays have fewer
+# dimensions than this, allowing `reshape` to update the shape in place.
+_SHAPE_BUFFER_SIZE = 8
+
+
 class ArrayWrapper:
     """Small wrapper making Python arrays compatible with ``mts_array_t``."""
 
+    # a new wrapper is created for every array allocated by metatensor-core, using
+    # slots makes these allocations (and attribute access in callbacks) cheaper
+    __slots__ = ("array", "_shape", "_ndim", "_backend", "_mts_array")
+
     def __init__(self, array):
         self.array = array
-        self._shape = ctypes.ARRAY(c_uintptr_t, len(array.shape))(*array.shape)
-
-        if _is_numpy_array(array):
-            array_origin = _origin_numpy()
-        elif _is_torch_array(array):
-            array_origin = _origin_pytorch()
-        else:
-            raise ValueError(f"unknown array type: {type(array)}")
-
-        mts_array = mts_array_t()
-        # `mts_array_t::ptr` is a pointer to the PyObject `self`
-        mts_array.ptr = ctypes.cast(
-            ctypes.pointer(self._get_py_object()), ctypes.c_void_p
-        )
 
-        @catch_exceptions
-        def mts_array_origin(this, origin):
-            origin[0] = array_origin
+        shape = array.shape
+        self._shape = (c_uintptr_t * max(len(shape), _SHAPE_BUFFER_SIZE))(*shape)
+        self._ndim = len(shape)
 
-        # use storage.XXX.__class__ to get the right type for all functions
-        mts_array.origin = mts_array.origin.__class__(mts_array_origin)
+        # the backend can not change during the lifetime of the wrapper (reshape
+        # and swap_axes keep the array type), so we only look it up once here
+        self._backend = _array_backend(array)
 
-        mts_array.data = mts_array.data.__class__(_mts_array_data)
-
-        mts_array.shape = mts_array.shape.__class__(_mts_array_shape)
-        mts_array.reshape = mts_array.reshape.__class__(_mts_array_reshape)
-        mts_array.swap_axes = mts_array.swap_axes.__class__(_mts_array_swap_axes)
-
-        mts_array.create = mts_array.create.__class__(_mts_array_create)
-        mts_array.copy = mts_array.copy.__class__(_mts_array_copy)
-        mts_array.destroy = mts_array.destroy.__class__(_mts_array_destroy)
-
-        mts_array.move_samples_from = mts_array.move_samples_from.__class__(
-            _mts_array_move_samples_from
-        )
+        # all the callbacks are shared between arrays with the same backend, we
+        # only need to copy them from the template and set `ptr`
+        mts_array = mts_array_t.from_buffer_copy(self._backend.mts_array)
+        # `mts_array_t::ptr` is the `PyObject*` for `self`
+        mts_array.ptr = id(self)
 
         self._mts_array = mts_array
 
@@ -222,8 +235,18 @@ class ArrayWrapper:
 
 
 def _object_from_ptr(ptr):
-    """Extract the Python object from a pointer to the PyObject"""
-    return ctypes.cast(ptr, ctypes.POINTER(ctypes.py_object)).contents.value
+    """Extract the Python object from a ``PyObject*``"""
+    return ctypes.cast(ptr, ctypes.py_object).value
+
+
+@catch_exceptions
+def _mts_array_origin_numpy(this, origin):
+    origin[0] = _origin_numpy()
+
+
+@catch_exceptions
+def _mts_array_origin_torch(this, origin):
+    origin[0] = _origin_pytorch()
 
 
 @catch_exceptions
@@ -263,19 +286,22 @@ def _mts_array_shape(this, shape_ptr, shape_count):
     wrapper = _object_from_ptr(this)
 
     shape_ptr[0] = wrapper._shape
-    shape_count[0] = len(wrapper._shape)
+    shape_count[0] = wrapper._ndim
 
 
 @catch_exceptions
 def _mts_array_reshape(this, shape_ptr, shape_count):
     wrapper = _object_from_ptr(this)
 
-    shape = []
-    for i in range(shape_count):
-        shape.append(shape_ptr[i])
+    # slicing the pointer reads all values in a single call
+    shape = tuple(shape_ptr[:shape_count])
 
     wrapper.array = wrapper.array.reshape(shape)
-    wrapper._shape = ctypes.ARRAY(c_uintptr_t, len(shape))(*shape)
+
+    if shape_count > len(wrapper._shape):
+        wrapper._shape = (c_uintptr_t * shape_count)()
+    wrapper._shape[:shape_count] = shape
+    wrapper._ndim = shape_count
 
 
 @catch_exceptions
@@ -283,23 +309,17 @@ def _mts_array_swap_axes(this, axis_1, axis_2):
     wrapper = _object_from_ptr(this)
     wrapper.array = wrapper.array.swapaxes(axis_1, axis_2)
 
-    shape = wrapper.array.shape
-    wrapper._shape = ctypes.ARRAY(c_uintptr_t, len(shape))(*shape)
+    shape = wrapper._shape
+    shape[axis_1], shape[axis_2] = shape[axis_2], shape[axis_1]
 
 
 @catch_exceptions
 def _mts_array_create(this, shape_ptr, shape_count, new_array):
     wrapper = _object_from_ptr(this)
 
-    shape = []
-    for i in range(shape_count):
-        shape.append(shape_ptr[i])
-    dtype = wrapper.array.dtype
+    shape = tuple(shape_ptr[:shape_count])
 
-    if _is_numpy_array(wrapper.array):
-        array = np.zeros(shape, dtype=dtype)
-    elif _is_torch_array(wrapper.array):
-        array = torch.zeros(shape, dtype=dtype, device=wrapper.array.device)
+    array = wrapper._backend.zeros(wrapper.array, shape)
 
     new_wrapper = ArrayWrapper(array)
     new_array[0] = new_wrapper.into_mts_array()
@@ -308,11 +328,7 @@ def _mts_array_create(this, shape_ptr, shape_count, new_array):
 @catch_exceptions
 def _mts_array_copy(this, new_array):
     wrapper = _object_from_ptr(this)
-
-    if _is_numpy_array(wrapper.array):
-        array = wrapper.array.copy()
-    elif _is_torch_array(wrapper.array):
-        array = wrapper.array.clone()
+    array = wrapper._backend.copy(wrapper.array)
 
     new_wrapper = ArrayWrapper(array)
     new_array[0] = new_wrapper.into_mts_array()
@@ -337,11 +353,121 @@ def _mts_array_move_samples_from(
     output = _object_from_ptr(this).array
     input = _object_from_ptr(input).array
 
-    input_samples = []
-    output_samples = []
-    for i in range(samples_count):
-        input_samples.append(samples_ptr[i].input)
-        output_samples.append(samples_ptr[i].output)
+    if samples_count == 0:
+        return
+
+    # view the `mts_sample_mapping_t` array as a (samples_count, 2) array of
+    # integers, containing (input, output) pairs. This does not go through
+    # `np.ctypeslib.as_array`, which creates (and caches forever) a new ctypes
+    # pointer type for every different `samples_count`.
+    samples_buffer = (c_uintptr_t * (2 * samples_count)).from_address(
+        ctypes.addressof(samples_ptr.contents)
+    )
+    samples = np.frombuffer(samples_buffer, dtype=np.uintp).reshape(samples_count, 2)
+    input_samples = _samples_index(samples[:, 0], input)
+    output_samples = _samples_index(samples[:, 1], output)
 
     properties = slice(property_start, property_end)
     output[output_samples, ..., properties] = input[input_samples, ..., :]
+
+
+def _samples_index(samples, array):
+    """
+    Get an index for the given ``samples`` in ``array``. Consecutive samples (which
+    is the case when moving all samples of a block at once) are converted to a
+    slice, which does not require a temporary copy of the data; other samples are
+    converted to an array of integers.
+    """
+    start = int(samples[0])
+    stop = start + len(samples)
+    if int(samples[-1]) == stop - 1 and np.all(np.diff(samples) == 1):
+        return slice(start, stop)
+
+    samples = samples.astype(np.int64)
+    if _is_torch_array(array):
+        samples = torch.from_numpy(samples).to(array.device)
+
+    return samples
+
+
+def _create_mts_array_template(origin):
+    """
+    Create a ``mts_array_t`` containing the callbacks shared by all
+    :py:class:`ArrayWrapper` with the given ``origin`` callback. The ``ctypes``
+    function pointers are only created once, and then copied in each new
+    ``mts_array_t``.
+    """
+    mts_array = mts_array_t()
+
+    # use storage.XXX.__class__ to get the right type for all functions
+    mts_array.origin = mts_array.origin.__class__(origin)
+    mts_array.data = mts_array.data.__class__(_mts_array_data)
+
+    mts_array.shape = mts_array.shape.__class__(_mts_array_shape)
+    mts_array.reshape = mts_array.reshape.__class__(_mts_array_reshape)
+    mts_array.swap_axes = mts_array.swap_axes.__class__(_mts_array_swap_axes)
+
+    mts_array.create = mts_array.create.__class__(_mts_array_create)
+    mts_array.copy = mts_array.copy.__class__(_mts_array_copy)
+    mts_array.destroy = mts_array.destroy.__class__(_mts_array_destroy)
+
+    mts_array.move_samples_from = mts_array.move_samples_from.__class__(
+        _mts_array_move_samples_from
+    )
+
+    return mts_array
+
+
+_ArrayBackend = namedtuple("_ArrayBackend", ["mts_array", "zeros", "copy"])
+"""
+Data used by ``ArrayWrapper`` for a given array type: ``mts_array`` is the
+template ``mts_array_t`` containing all callbacks, ``zeros(array, shape)``
+creates a new array filled with zeros with the same dtype/device as ``array``,
+and ``copy(array)`` duplicates ``array``.
+
+The templates must stay alive for the whole program, since they keep the
+``ctypes`` function pointers alive.
+"""
+
+
+def _numpy_zeros(array, shape):
+    # `mts_array_t::create` must return arrays filled with zeros: metatensor-core
+    # only moves some of the data in the new arrays (e.g. in `keys_to_properties`)
+    # and relies on the remaining entries being zero, so we can not use
+    # `np.empty` here. `np.zeros` uses `calloc`, which gets already zeroed
+    # memory pages from the OS for large arrays.
+    return np.zeros(shape, dtype=array.dtype)
+
+
+def _numpy_subclass_copy(array):
+    return array.copy()
+
+
+_NUMPY_BACKEND = _ArrayBackend(
+    _create_mts_array_template(_mts_array_origin_numpy),
+    _numpy_zeros,
+    np.ndarray.copy,
+)
+_NUMPY_SUBCLASS_BACKEND = _NUMPY_BACKEND._replace(copy=_numpy_subclass_copy)
+_ARRAY_BACKENDS = {np.ndarray: _NUMPY_BACKEND}
+
+if HAS_TORCH:
+
+    def _torch_subclass_new_zeros(array, shape):
+        return array.new_zeros(shape)
+
+    def _torch_subclass_clone(array):
+        return array.clone()
+
+    # `new_zeros` takes dtype and device from the existing tensor directly in
+    # C++, instead of going through Python attribute access
+    _TORCH_BACKEND = _ArrayBackend(
+        _create_mts_array_template(_mts_array_origin_torch),
+        torch.Tensor.new_zeros,
+        torch.Tensor.clone,
+    )
+    _TORCH_SUBCLASS_BACKEND = _TORCH_BACKEND._replace(
+        zeros=_torch_subclass_new_zeros,
+        copy=_torch_subclass_clone,
+    )
+    _ARRAY_BACKENDS[torch.Tensor] = _TORCH_BACKEND
@@ -109,8 +109,11 @@ def data_origin_name(origin):
 
     lib = _get_library()
 
+    # origin names are short, so a small buffer is enough for a single call in
+    # almost all cases. The buffer will grow if the name does not fit.
     return _call_with_growing_buffer(
-        lambda buffer, bufflen: lib.mts_get_data_origin(origin, buffer, bufflen)
+        lambda buffer, bufflen: lib.mts_get_data_origin(origin, buffer, bufflen),
+        initial=256,
     )
 
 
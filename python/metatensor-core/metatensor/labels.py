@@ -458,6 +458,15 @@ class Labels:
                 f"can only compare between Labels for equality, got {type(other)}"
             )
 
+        if self is other:
+            return True
+
+        if not self.is_view() and not other.is_view():
+            if self._labels.internal_ptr_ == other._labels.internal_ptr_:
+                # both Labels refer to the same data in metatensor-core (e.g.
+                # the samples of the same block), no need to compare values
+                return True
+
         return (
             self._names == other._names
             and self._values.shape == other._values.shape
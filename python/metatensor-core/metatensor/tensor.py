@@ -1,4 +1,3 @@
-import copy
 import ctypes
 import pathlib
 import warnings
@@ -144,7 +143,8 @@ class TensorMap:
         """
         Get a deep copy of this TensorMap, including all the data and metadata
         """
-        return copy.deepcopy(self)
+        # call `__deepcopy__` directly instead of going through `copy.deepcopy`
+        return self.__deepcopy__({})
 
     def __len__(self):
         return len(self.keys)
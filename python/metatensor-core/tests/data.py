@@ -54,6 +54,13 @@ class ArrayWrapperMixin:
 
         assert _get_shape(mts_array, self) == [2, 3, 2, 2]
 
+        # more dimensions than the pre-allocated shape buffer
+        new_shape = ctypes.ARRAY(c_uintptr_t, 10)(2, 3, 2, 2, 1, 1, 1, 1, 1, 1)
+        status = mts_array.reshape(mts_array.ptr, new_shape, len(new_shape))
+        assert status == MTS_SUCCESS
+
+        assert _get_shape(mts_array, self) == [2, 3, 2, 2, 1, 1, 1, 1, 1, 1]
+
         free_mts_array(mts_array)
 
     def test_swap_axes(self):
@@ -162,6 +169,79 @@ class ArrayWrapperMixin:
         free_mts_array(mts_array)
         free_mts_array(mts_array_other)
 
+    def test_move_multiple_samples_from(self):
+        array = self.create_array((5, 2))
+        wrapper = metatensor.data.ArrayWrapper(array)
+        mts_array = wrapper.into_mts_array()
+
+        other = self.create_array((3, 2))
+        other[:, 0] = 1.0
+        other[:, 1] = 2.0
+        other[2, :] = 3.0
+        wrapper_other = metatensor.data.ArrayWrapper(other)
+        mts_array_other = wrapper_other.into_mts_array()
+
+        # consecutive samples in both arrays
+        moves = ctypes.ARRAY(mts_sample_mapping_t, 2)(
+            mts_sample_mapping_t(input=0, output=1),
+            mts_sample_mapping_t(input=1, output=2),
+        )
+        mts_array.move_samples_from(
+            mts_array.ptr, mts_array_other.ptr, moves, len(moves), 0, 2
+        )
+
+        # non-consecutive samples
+        moves = ctypes.ARRAY(mts_sample_mapping_t, 2)(
+            mts_sample_mapping_t(input=2, output=4),
+            mts_sample_mapping_t(input=0, output=0),
+        )
+        mts_array.move_samples_from(
+            mts_array.ptr, mts_array_other.ptr, moves, len(moves), 0, 2
+        )
+
+        expected = np.array(
+            [[1.0, 2.0], [1.0, 2.0], [1.0, 2.0], [0.0, 0.0], [3.0, 3.0]]
+        )
+        assert_equal(np.array(array), expected)
+
+        free_mts_array(mts_array)
+        free_mts_array(mts_array_other)
+
+    def test_move_samples_from_no_leak(self, monkeypatch):
+        array = self.create_array((8, 2))
+        wrapper = metatensor.data.ArrayWrapper(array)
+        mts_array = wrapper.into_mts_array()
+
+        other = self.create_array((8, 2))
+        wrapper_other = metatensor.data.ArrayWrapper(other)
+        mts_array_other = wrapper_other.into_mts_array()
+
+        moves = [
+            ctypes.ARRAY(mts_sample_mapping_t, count)(
+                *[mts_sample_mapping_t(input=i, output=i) for i in range(count)]
+            )
+            for count in range(1, 9)
+        ]
+
+        # ctypes caches forever every pointer type it creates, so creating a
+        # new one for each different number of samples would leak memory
+        def forbidden(*args, **kwargs):
+            raise AssertionError("move_samples_from should not create ctypes types")
+
+        monkeypatch.setattr(ctypes, "POINTER", forbidden)
+        monkeypatch.setattr(np.ctypeslib, "as_array", forbidden)
+
+        for move in moves:
+            status = mts_array.move_samples_from(
+                mts_array.ptr, mts_array_other.ptr, move, len(move), 0, 2
+            )
+            assert status == MTS_SUCCESS
+
+        monkeypatch.undo()
+
+        free_mts_array(mts_array)
+        free_mts_array(mts_array_other)
+
 
 class TestNumpyData(ArrayWrapperMixin):
     def expected_origin(self):
@@ -181,6 +261,35 @@ if HAS_TORCH:
             return torch.zeros(shape, device="cpu")
 
 
+class CustomCopyArray(np.ndarray):
+    def copy(self, *args, **kwargs):
+        copy = super().copy(*args, **kwargs)
+        copy.custom_copy = True
+        return copy
+
+
+def test_copy_subclass():
+    array = np.zeros((2, 3)).view(CustomCopyArray)
+    wrapper = metatensor.data.ArrayWrapper(array)
+    mts_array = wrapper.into_mts_array()
+
+    copy = mts_array_t()
+    status = mts_array.copy(mts_array.ptr, copy)
+    assert status == MTS_SUCCESS
+
+    # the copy should go through the subclass's own `copy`
+    array_copy = metatensor.data.mts_array_to_python_array(copy)
+    assert isinstance(array_copy, CustomCopyArray)
+    assert array_copy.custom_copy
+
+    # plain arrays should still use the base class backend
+    wrapper = metatensor.data.ArrayWrapper(np.zeros((2, 3)))
+    assert wrapper._backend is metatensor.data.array._NUMPY_BACKEND
+
+    free_mts_array(mts_array)
+    free_mts_array(copy)
+
+
 def _get_shape(mts_array, test):
     shape_ptr = ctypes.POINTER(c_uintptr_t)()
     shape_count = c_uintptr_t()
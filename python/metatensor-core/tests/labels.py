@@ -1,7 +1,7 @@
 import numpy as np
 import pytest
 
-from metatensor import Labels, MetatensorError
+from metatensor import Labels, MetatensorError, TensorBlock
 
 
 def test_constructor():
@@ -371,6 +371,17 @@ def test_eq():
     assert labels_1[0] != labels_4[0]
     assert labels_1[1] == labels_3[1]
 
+    # Labels sharing the same underlying data
+    block = TensorBlock(
+        values=np.zeros((2, 1)),
+        samples=labels_1,
+        components=[],
+        properties=Labels.range("p", 1),
+    )
+    assert block.samples == block.samples
+    assert block.samples != labels_3
+    assert block.samples.view("b") != block.samples.view("a")
+
 
 def test_union():
     first = Labels(["aa", "bb"], np.array([[0, 1], [1, 2]]))
@@ -1,4 +1,4 @@
-from typing import List, Union
+from typing import List, Tuple, Union
 
 from ._backend import TensorBlock, TensorMap
 
@@ -9,6 +9,30 @@ class NotEqualError(Exception):
     pass
 
 
+def _validate_check(check: Union[List[str], str]) -> List[str]:
+    """
+    Validate the ``check`` parameter of the functions below, and convert it to the list
+    of metadata to check. Raises a ``ValueError`` if ``check`` is not ``'all'`` or a
+    list containing only ``'samples'``, ``'components'``, and ``'properties'``.
+    """
+    if isinstance(check, str):
+        if check == "all":
+            metadata_to_check = ["samples", "components", "properties"]
+        else:
+            raise ValueError("`check` must be a list of strings or 'all'")
+    else:
+        metadata_to_check = check
+
+    for metadata in metadata_to_check:
+        if metadata not in ["samples", "components", "properties"]:
+            raise ValueError(
+                f"'{metadata}' does not refer to metadata to check, "
+                "choose from 'samples', 'properties' and 'components'"
+            )
+
+    return metadata_to_check
+
+
 def _check_same_keys(a: TensorMap, b: TensorMap, fname: str) -> bool:
     """
     Returns true if the keys of 2 TensorMaps are the same, without specification of the
@@ -42,25 +66,44 @@ def _check_same_keys_impl(a: TensorMap, b: TensorMap, fname: str) -> str:
         used to generate a meaningful error message.
     """
 
+    message, _ = _check_same_keys_order_impl(a, b, fname)
+    return message
+
+
+def _check_same_keys_order_impl(
+    a: TensorMap, b: TensorMap, fname: str
+) -> Tuple[str, bool]:
+    """
+    Same as :py:func:`_check_same_keys_impl`, additionally returning whether the keys
+    are in the same order in both TensorMaps. This allows callers to pair the blocks
+    by position without comparing the keys a second time.
+    """
+
     keys_a = a.keys
     keys_b = b.keys
 
     if keys_a.names != keys_b.names:
-        return (
+        message = (
             f"inputs to '{fname}' should have the same keys names, "
             f"got '{keys_a.names}' and '{keys_b.names}'"
         )
+        return message, False
 
     if len(keys_a) != len(keys_b):
-        return (
+        message = (
             f"inputs to '{fname}' should have the same number of blocks, "
             f"got {len(keys_a)} and {len(keys_b)}"
         )
+        return message, False
+
+    if keys_a == keys_b:
+        # same keys in the same order, no need to check each entry separately
+        return "", True
 
     if not all([keys_b[i] in keys_a for i in range(len(keys_b))]):
-        return f"inputs to '{fname}' should have the same keys"
+        return f"inputs to '{fname}' should have the same keys", False
 
-    return ""
+    return "", False
 
 
 def _check_blocks(
@@ -132,14 +175,19 @@ def _check_blocks_impl(
         any of ``'samples'``, ``'components'``, and ``'properties'``; or the string
         ``'all'`` to check everything. Defaults to ``'all'``.
     """
-    if isinstance(check, str):
-        if check == "all":
-            metadata_to_check = ["samples", "components", "properties"]
-        else:
-            raise ValueError("`check` must be a list of strings or 'all'")
-    else:
-        metadata_to_check = check
+    return _check_blocks_metadata_impl(a, b, fname, _validate_check(check))
+
 
+def _check_blocks_metadata_impl(
+    a: TensorBlock,
+    b: TensorBlock,
+    fname: str,
+    metadata_to_check: List[str],
+) -> str:
+    """
+    Same as :py:func:`_check_blocks_impl`, for a list of metadata that was already
+    validated with :py:func:`_validate_check`.
+    """
     for metadata in metadata_to_check:
         if metadata == "samples":
             if not a.samples == b.samples:
@@ -165,11 +213,6 @@ def _check_blocks_impl(
                         f"inputs to '{fname}' should have the same components, "
                         "but they are not the same or not in the same order"
                     )
-        else:
-            raise ValueError(
-                f"'{metadata}' does not refer to metadata to check, "
-                "choose from 'samples', 'properties' and 'components'"
-            )
     return ""
 
 
@@ -259,54 +302,64 @@ def _check_same_gradients_impl(
         ``'all'`` to check everything. Defaults to ``'all'``. If you only want to check
         if the two blocks have the same gradients, pass an empty list ``check=[]``.
     """
-    if isinstance(check, str):
-        if check == "all":
-            metadata_to_check = ["samples", "components", "properties"]
-        else:
-            raise ValueError("`check` must be a list of strings or 'all'")
-    else:
-        metadata_to_check = check
+    return _check_same_gradients_metadata_impl(a, b, fname, _validate_check(check))
 
-    err_msg = f"inputs to '{fname}' should have the same gradients: "
+
+def _check_same_gradients_metadata_impl(
+    a: TensorBlock,
+    b: TensorBlock,
+    fname: str,
+    metadata_to_check: List[str],
+) -> str:
+    """
+    Same as :py:func:`_check_same_gradients_impl`, for a list of metadata that was
+    already validated with :py:func:`_validate_check`.
+    """
     gradients_list_a = a.gradients_list()
     gradients_list_b = b.gradients_list()
 
+    if len(gradients_list_a) == 0 and len(gradients_list_b) == 0:
+        return ""
+
     if len(gradients_list_a) != len(gradients_list_b) or (
         not all([parameter in gradients_list_b for parameter in gradients_list_a])
     ):
         return f"inputs to '{fname}' should have the same gradient parameters"
 
+    if len(metadata_to_check) == 0:
+        # only the gradient parameters needed to be checked
+        return ""
+
+    # error messages are only created when the metadata differs, since formatting
+    # them is more expensive than the comparison itself
     for parameter, grad_a in a.gradients():
         grad_b = b.gradient(parameter)
 
         for metadata in metadata_to_check:
-            err_msg_1 = (
-                f"gradient '{parameter}' {metadata} are not the same or not in the "
-                "same order"
-            )
-
+            same_metadata = True
             if metadata == "samples":
-                if not grad_a.samples == grad_b.samples:
-                    return err_msg + err_msg_1
+                same_metadata = grad_a.samples == grad_b.samples
 
             elif metadata == "properties":
-                if not grad_a.properties == grad_b.properties:
-                    return err_msg + err_msg_1
+                same_metadata = grad_a.properties == grad_b.properties
 
             elif metadata == "components":
                 if len(grad_a.components) != len(grad_b.components):
-                    extra = (
+                    return (
+                        f"inputs to '{fname}' should have the same gradients: "
                         f"gradient '{parameter}' have different number of components"
                     )
-                    return err_msg + extra
 
                 for c1, c2 in zip(grad_a.components, grad_b.components):
                     if not c1 == c2:
-                        return err_msg + err_msg_1
-            else:
-                raise ValueError(
-                    f"{metadata} is not a valid property to check, "
-                    "choose from 'samples', 'properties' and 'components'"
+                        same_metadata = False
+                        break
+
+            if not same_metadata:
+                return (
+                    f"inputs to '{fname}' should have the same gradients: "
+                    f"gradient '{parameter}' {metadata} are not the same or not in "
+                    "the same order"
                 )
     return ""
 
@@ -13,9 +13,10 @@ from ._backend import (
 )
 from ._utils import (
     NotEqualError,
-    _check_blocks_impl,
-    _check_same_gradients_impl,
-    _check_same_keys_impl,
+    _check_blocks_metadata_impl,
+    _check_same_gradients_metadata_impl,
+    _check_same_keys_order_impl,
+    _validate_check,
 )
 
 
@@ -30,12 +31,24 @@ def _equal_metadata_impl(
         if not check_isinstance(tensor_2, TensorMap):
             return f"`tensor_2` must be a metatensor TensorMap, not {type(tensor_2)}"
 
-    message = _check_same_keys_impl(tensor_1, tensor_2, "equal_metadata_raise")
+    # validate `check` once, instead of doing it again for every block
+    metadata_to_check = _validate_check(check)
+
+    message, same_order = _check_same_keys_order_impl(
+        tensor_1, tensor_2, "equal_metadata_raise"
+    )
     if message != "":
         return message
 
-    for key in [tensor_1.keys[i] for i in range(len(tensor_1.keys))]:
-        message = _equal_metadata_block_impl(tensor_1[key], tensor_2[key], check=check)
+    if same_order:
+        # the keys are in the same order, blocks can be matched by position
+        blocks_2 = tensor_2.blocks()
+    else:
+        keys_1 = tensor_1.keys
+        blocks_2 = [tensor_2.block(keys_1[i]) for i in range(len(keys_1))]
+
+    for block_1, block_2 in zip(tensor_1.blocks(), blocks_2):
+        message = _equal_block_metadata(block_1, block_2, metadata_to_check)
         if message != "":
             return message
 
@@ -53,21 +66,29 @@ def _equal_metadata_block_impl(
         if not check_isinstance(block_2, TensorBlock):
             return f"`block_2` must be a metatensor TensorBlock, not {type(block_2)}"
 
-    check_blocks_message = _check_blocks_impl(
+    return _equal_block_metadata(block_1, block_2, _validate_check(check))
+
+
+def _equal_block_metadata(
+    block_1: TensorBlock,
+    block_2: TensorBlock,
+    metadata_to_check: List[str],
+) -> str:
+    check_blocks_message = _check_blocks_metadata_impl(
         block_1,
         block_2,
         "equal_metadata_block_raise",
-        check=check,
+        metadata_to_check,
     )
 
     if check_blocks_message != "":
         return check_blocks_message
 
-    check_same_gradient_message = _check_same_gradients_impl(
+    check_same_gradient_message = _check_same_gradients_metadata_impl(
         block_1,
         block_2,
         "equal_metadata_block_raise",
-        check=check,
+        metadata_to_check,
     )
 
     if check_same_gradient_message != "":
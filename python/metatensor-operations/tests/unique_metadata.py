@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 
 import numpy as np
 import pytest
@@ -13,149 +14,149 @@ DATA_ROOT = os.path.join(os.path.dirname(__file__), "data")
 TEST_FILE = "qm7-spherical-expansion.npz"
 
 
-@pytest.fixture
+# expected unique metadata, created once for all tests
+BLOCK_SAMPLES = Labels(
+    names=["s"],
+    values=np.asarray([0, 1, 3], dtype=np.int32)[:, None],
+)
+BLOCK_GRADIENT_SAMPLES = Labels(
+    names=["sample", "g"],
+    values=np.array([[0, -2], [0, 3], [2, -2]], dtype=np.int32),
+)
+BLOCK_PROPERTIES = Labels(
+    names=["p"],
+    values=np.asarray([3, 4, 5], dtype=np.int32)[:, None],
+)
+
+TENSOR_SAMPLES = Labels(
+    names=["s"],
+    values=np.asarray([0, 1, 2, 3, 4, 5, 6, 8], dtype=np.int32)[:, None],
+)
+TENSOR_GRADIENT_SAMPLES = Labels(
+    names=["sample", "g"],
+    values=np.array(
+        [[0, -2], [0, 1], [0, 3], [1, -2], [2, -2], [2, 3], [3, 3]], dtype=np.int32
+    ),
+)
+TENSOR_PROPERTIES = Labels(
+    names=["p"],
+    values=np.asarray([0, 3, 4, 5], dtype=np.int32)[:, None],
+)
+LARGE_TENSOR_PROPERTIES = Labels(
+    names=["p"],
+    values=np.asarray([0, 1, 2, 3, 4, 5, 6, 7], dtype=np.int32)[:, None],
+)
+
+# values not present in any block, used to slice blocks down to be empty
+EMPTY_SLICE_VALUES = np.array([[-1]], dtype=np.int32)
+
+
+@lru_cache(maxsize=None)
+def _load_tensor(path):
+    return metatensor.load(path)
+
+
+# these tensors are only read by the tests below, so they can be shared between all
+# tests in this module
+@pytest.fixture(scope="module")
 def tensor():
     return _tests_utils.tensor()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def large_tensor():
     return _tests_utils.large_tensor()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def real_tensor():
-    return metatensor.load(os.path.join(DATA_ROOT, TEST_FILE))
-
-
-def test_unique_metadata_block(large_tensor):
-    # unique metadata along sample axis
-    target_samples = Labels(names=["s"], values=np.array([0, 1, 3]).reshape(-1, 1))
-    actual_samples = metatensor.unique_metadata_block(
-        large_tensor.block(1),
-        axis="samples",
-        names="s",
-    )
-    assert target_samples == actual_samples
-
-    # unique metadata of gradient along sample axis
-    names = ["sample", "g"]
-    target_samples = Labels(names=names, values=np.array([[0, -2], [0, 3], [2, -2]]))
-    actual_samples = metatensor.unique_metadata_block(
-        large_tensor.block(1),
-        axis="samples",
+    return _load_tensor(os.path.join(DATA_ROOT, TEST_FILE))
+
+
+@pytest.fixture(scope="module")
+def large_block(large_tensor):
+    return large_tensor.block(1)
+
+
+@pytest.fixture(scope="module")
+def real_block(real_tensor):
+    return real_tensor.block(0)
+
+
+@pytest.mark.parametrize(
+    "axis, names, gradient, expected",
+    [
+        # unique metadata along sample axis
+        ("samples", "s", None, BLOCK_SAMPLES),
+        # unique metadata of gradient along sample axis
+        ("samples", ["sample", "g"], "g", BLOCK_GRADIENT_SAMPLES),
+        # unique metadata along properties axis
+        ("properties", "p", None, BLOCK_PROPERTIES),
+        # unique metadata of gradient along properties axis
+        ("properties", ["p"], "g", BLOCK_PROPERTIES),
+    ],
+)
+def test_unique_metadata_block(large_block, axis, names, gradient, expected):
+    actual = metatensor.unique_metadata_block(
+        large_block,
+        axis=axis,
         names=names,
-        gradient="g",
+        gradient=gradient,
     )
-    assert target_samples == actual_samples
+    assert expected == actual
 
-    # unique metadata along properties axis
-    properties = [3, 4, 5]
-    target_properties = Labels(names=["p"], values=np.array([[p] for p in properties]))
-    actual_properties = metatensor.unique_metadata_block(
-        large_tensor.block(1), axis="properties", names="p"
-    )
-    assert target_properties == actual_properties
 
-    # unique metadata of gradient along properties axis
-    names = ["p"]
-    target_properties = Labels(names=names, values=np.array([[3], [4], [5]]))
-    actual_properties = metatensor.unique_metadata_block(
-        large_tensor.block(1),
-        axis="properties",
-        names=names,
-        gradient="g",
-    )
-    assert target_properties == actual_properties
-
-
-def test_empty_block(real_tensor):
-    target_samples = Labels(names=["system"], values=np.empty((0, 1)))
+@pytest.mark.parametrize("axis, name", [("samples", "system"), ("properties", "n")])
+def test_empty_block(real_block, axis, name):
     # slice block to be empty
     sliced_block = metatensor.slice_block(
-        real_tensor.block(0),
-        axis="samples",
-        labels=Labels(names=["system"], values=np.array([[-1]])),
+        real_block,
+        axis=axis,
+        labels=Labels(names=[name], values=EMPTY_SLICE_VALUES),
     )
-    actual_samples = metatensor.unique_metadata_block(
-        sliced_block,
-        axis="samples",
-        names="system",
-    )
-    assert target_samples == actual_samples
-    assert len(actual_samples) == 0
+    actual = metatensor.unique_metadata_block(sliced_block, axis=axis, names=name)
 
-    target_properties = Labels(names=["n"], values=np.empty((0, 1)))
-    sliced_block = metatensor.slice_block(
-        real_tensor.block(0),
-        axis="properties",
-        labels=Labels(names=["n"], values=np.array([[-1]])),
-    )
-    actual_properties = metatensor.unique_metadata_block(
-        sliced_block,
-        axis="properties",
-        names="n",
-    )
-    assert target_properties == actual_properties
-    assert len(actual_properties) == 0
+    target = Labels(names=[name], values=np.empty((0, 1), dtype=np.int32))
+    assert target == actual
+    assert len(actual) == 0
 
 
 def test_unique_metadata(tensor, large_tensor):
     # unique metadata along samples
-    target_samples = Labels(
-        names=["s"],
-        values=np.array([0, 1, 2, 3, 4, 5, 6, 8]).reshape(-1, 1),
-    )
     actual_samples = metatensor.unique_metadata(tensor, "samples", "s")
-    assert target_samples == actual_samples
+    assert TENSOR_SAMPLES == actual_samples
 
     actual_samples = metatensor.unique_metadata(large_tensor, "samples", "s")
-    assert actual_samples == target_samples
+    assert actual_samples == TENSOR_SAMPLES
 
     # unique metadata along samples for gradients
-    names = ["sample", "g"]
-    target_samples = Labels(
-        names=names,
-        values=np.array([[0, -2], [0, 1], [0, 3], [1, -2], [2, -2], [2, 3], [3, 3]]),
-    )
     actual_samples = metatensor.unique_metadata(
         tensor,
         axis="samples",
-        names=names,
+        names=["sample", "g"],
         gradient="g",
     )
-    assert actual_samples == target_samples
+    assert actual_samples == TENSOR_GRADIENT_SAMPLES
 
     # unique metadata along properties
-    target_properties = Labels(
-        names=["p"], values=np.array([0, 3, 4, 5]).reshape(-1, 1)
-    )
     actual_properties = metatensor.unique_metadata(
         tensor,
         axis="properties",
         names=["p"],  # names passed as list
     )
-    assert target_properties == actual_properties
+    assert TENSOR_PROPERTIES == actual_properties
 
-    target_properties = Labels(
-        names=["p"], values=np.array([0, 1, 2, 3, 4, 5, 6, 7]).reshape(-1, 1)
-    )
     actual_properties = metatensor.unique_metadata(
         large_tensor,
         axis="properties",
         names=("p",),  # names passed as tuple
     )
-    assert target_properties == actual_properties
+    assert LARGE_TENSOR_PROPERTIES == actual_properties
 
-    names = ["p"]
-    target_properties = Labels(
-        names=names,
-        values=np.array([0, 3, 4, 5]).reshape(-1, 1),
-    )
     actual_properties = metatensor.unique_metadata(
-        tensor, axis="properties", names=names, gradient="g"
+        tensor, axis="properties", names=["p"], gradient="g"
     )
-    assert target_properties == actual_properties
+    assert TENSOR_PROPERTIES == actual_properties
 
 
 def test_unique_metadata_block_errors(real_tensor):